@@ -0,0 +1,87 @@
+"""
+BlackLake Python SDK Fast Models
+
+msgspec Struct mirrors of the search response models. msgspec decodes
+JSON straight into C-backed Struct instances in a single pass, skipping
+the bytes -> dict -> Pydantic hop on the hot search path. msgspec is an
+optional dependency (the `fast` extra); importers must tolerate
+ImportError and fall back to the Pydantic models.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+import msgspec
+
+
+class SearchResultFast(msgspec.Struct, frozen=True, gc=False):
+    """Search result (mirrors models.SearchResult)."""
+
+    id: str
+    repo_name: str
+    path: str
+    name: str
+    content_type: Optional[str] = None
+    size: Optional[int] = None
+    modified_at: Optional[datetime] = None
+    classification: Optional[str] = None
+    score: Optional[float] = None
+    highlights: Optional[Dict[str, List[str]]] = None
+
+
+class SearchFacetFast(msgspec.Struct, frozen=True, gc=False):
+    """Search facet (mirrors models.SearchFacet)."""
+
+    name: str
+    values: List[Dict[str, Union[str, int]]] = []
+
+
+class SearchDataFast(msgspec.Struct, frozen=True):
+    """Typed payload of a search response."""
+
+    results: List[SearchResultFast] = []
+    total: int = 0
+    limit: int = 20
+    offset: int = 0
+    facets: List[SearchFacetFast] = []
+
+
+class SearchResponseFast(msgspec.Struct, frozen=True):
+    """
+    Search response decoded by msgspec.
+
+    Exposes the same read API as models.SearchResponse (results, total,
+    limit, offset, facets) so callers can treat the two interchangeably.
+    """
+
+    success: bool = True
+    data: SearchDataFast = msgspec.field(default_factory=SearchDataFast)
+
+    @property
+    def results(self) -> List[SearchResultFast]:
+        """Get search results."""
+        return self.data.results
+
+    @property
+    def total(self) -> int:
+        """Get total number of results."""
+        return self.data.total
+
+    @property
+    def limit(self) -> int:
+        """Get result limit."""
+        return self.data.limit
+
+    @property
+    def offset(self) -> int:
+        """Get result offset."""
+        return self.data.offset
+
+    @property
+    def facets(self) -> List[SearchFacetFast]:
+        """Get search facets."""
+        return self.data.facets
+
+
+# One decoder instance reused for every search call
+_SEARCH_DECODER = msgspec.json.Decoder(SearchResponseFast)
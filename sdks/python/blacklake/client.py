@@ -5,59 +5,245 @@ Main client for interacting with the BlackLake Data Portal API.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Union, Any
-from urllib.parse import urljoin
+import functools
+import threading
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union, Any
+from urllib.parse import quote
 
 import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
 from pydantic import BaseModel, Field
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
-from .exceptions import BlackLakeError, AuthenticationError, AuthorizationError, NotFoundError
-from .models import Repository, SearchResult, SearchResponse, TreeEntry, TreeResponse
+from . import __version__
+from .exceptions import (
+    BlackLakeError,
+    AuthenticationError,
+    AuthorizationError,
+    NotFoundError,
+    RateLimitError,
+)
+from .models import (
+    Repository,
+    SearchResult,
+    SearchResponse,
+    TreeEntry,
+    TreeResponse,
+    _RepoListAdapter,
+)
+
+try:
+    from ._fast_models import _SEARCH_DECODER
+except ImportError:  # msgspec is optional (the `fast` extra)
+    _SEARCH_DECODER = None
+
+# Only advertise Brotli when a decoder is installed (the `brotli` extra);
+# for large JSON payloads br compresses 15-30% tighter than gzip
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote(value: str, safe: str = "") -> str:
+    """URL-quote a path parameter, caching hot repeat values."""
+    return quote(value, safe=safe)
+
+
+# Transient statuses worth retrying before surfacing an error
+_RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+# Well-known statuses dispatch through one dict lookup instead of an
+# if/elif chain evaluated on every response
+_STATUS_EXC = {
+    401: (AuthenticationError, "Authentication failed"),
+    403: (AuthorizationError, "Access denied"),
+    404: (NotFoundError, "Resource not found"),
+    429: (RateLimitError, "Rate limit exceeded"),
+}
+
+
+class _RetryableStatus(Exception):
+    """Internal marker that a response status warrants a retry."""
+
+
+class BearerAuth(httpx.Auth):
+    """
+    Attach the API key as a Bearer token via httpx's auth flow.
+
+    Keeping Authorization out of the default header dict lets httpx
+    inject it per request and allows rotating the token on a live client
+    by assigning `auth.token`.
+    """
+
+    def __init__(self, token: str):
+        self.token = token
+
+    def auth_flow(self, request: httpx.Request):
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        yield request
+
+
+class _SuggestBatcher:
+    """
+    Coalesce search-suggestion calls issued within a short window.
+
+    Typeahead UIs call the suggest endpoint per keystroke; callers that
+    arrive inside `batch_window_ms` are collected and fired together as
+    one concurrent burst over the shared HTTP/2 connection, amortizing
+    the round-trip over the whole batch. Each caller awaits a future
+    resolved when its own query completes.
+    """
+
+    def __init__(
+        self,
+        client: "BlackLakeClient",
+        batch_window_ms: float = 10.0,
+        max_batch_size: int = 16,
+    ):
+        self._client = client
+        self._window = batch_window_ms / 1000.0
+        self._max_batch_size = max_batch_size
+        self._queue: "asyncio.Queue" = asyncio.Queue()
+        self._task: Optional["asyncio.Task"] = None
+
+    async def submit(self, query: str, count: int) -> List[str]:
+        """Queue a suggestion query and wait for its batch to complete."""
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((query, count, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        """Collect queued queries per window and fire each batch at once."""
+        while not self._queue.empty():
+            await asyncio.sleep(self._window)
+            batch = []
+            while not self._queue.empty() and len(batch) < self._max_batch_size:
+                batch.append(self._queue.get_nowait())
+            if not batch:
+                continue
+            responses = await asyncio.gather(
+                *(
+                    self._client._request(
+                        "GET", "/v1/search/suggest", params={"q": query, "count": count}
+                    )
+                    for query, count, _ in batch
+                ),
+                return_exceptions=True,
+            )
+            for (_, _, future), response in zip(batch, responses):
+                if future.cancelled():
+                    continue
+                if isinstance(response, Exception):
+                    future.set_exception(response)
+                else:
+                    future.set_result(response.get("data", []))
+
+    def close(self) -> None:
+        """Cancel the background drain task."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
 
 
 class BlackLakeClient:
     """BlackLake Data Portal API client."""
-    
+
+    # Precompiled endpoint templates: bound str.format methods are parsed
+    # once here instead of re-parsing an f-string template per call
+    _REPO_URL = "/v1/repos/{repo}".format
+    _TREE_URL = "/v1/repos/{repo}/tree/{ref}".format
+    _METADATA_URL = "/v1/repos/{repo}/metadata/{ref}/{path}".format
+    _UPLOAD_INIT_URL = "/v1/repos/{repo}/upload/init".format
+    _COMMIT_URL = "/v1/repos/{repo}/commit".format
+    _EXPORT_URL = "/v1/repos/{repo}/export".format
+    _EXPORT_STATUS_URL = "/v1/exports/{export_id}".format
+    _EXPORT_DOWNLOAD_URL = "/v1/exports/{export_id}/download".format
+
     def __init__(
         self,
         base_url: str = "http://localhost:8080",
         api_key: Optional[str] = None,
         timeout: float = 30.0,
         verify_ssl: bool = True,
+        cache_ttl: float = 30.0,
+        cache_size: int = 1024,
     ):
         """
         Initialize the BlackLake client.
-        
+
         Args:
             base_url: Base URL of the BlackLake API
             api_key: API key for authentication (optional)
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            cache_ttl: Seconds a cached GET response stays fresh (0 disables caching)
+            cache_size: Maximum number of cached GET responses
         """
-        self.base_url = base_url.rstrip("/")
+        # Pre-built httpx.URL; the AsyncClient joins endpoints against it
+        # so no per-call string manipulation is needed
+        self.base_url = httpx.URL(base_url)
         self.api_key = api_key
         self.timeout = timeout
         self.verify_ssl = verify_ssl
-        
-        # Create HTTP client
+
+        # Build default headers once as immutable httpx.Headers; they are
+        # installed on the client below so _request does not re-merge them
+        # per call. Authorization is handled by the auth object instead.
+        self._ua = f"blacklake-sdk-python/{__version__}"
+        self._default_headers = httpx.Headers(
+            {
+                "Content-Type": "application/json",
+                "User-Agent": self._ua,
+                "Accept-Encoding": _ACCEPT_ENCODING,
+            }
+        )
+        self._auth = BearerAuth(api_key) if api_key else None
+
+        # TTL + LRU cache for idempotent GETs, plus per-key locks so
+        # concurrent identical requests coalesce into one round-trip
+        self._cache_ttl = cache_ttl
+        self._response_cache: TTLCache = TTLCache(maxsize=cache_size, ttl=cache_ttl or 1)
+        self._inflight: Dict[Any, asyncio.Lock] = {}
+
+        # ETag revalidation cache: key -> (etag, parsed body). When the
+        # TTL cache has expired we send If-None-Match and a 304 reuses
+        # the stored body without transferring or re-parsing it
+        self._etags: LRUCache = LRUCache(maxsize=cache_size)
+
+        # Created lazily on first use so the queue binds to the running loop
+        self._suggest_batcher: Optional[_SuggestBatcher] = None
+
+        # Create HTTP client with an explicit connection pool and HTTP/2 so
+        # repeat calls reuse keep-alive connections and multiplex instead of
+        # paying a TCP/TLS handshake per request
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=timeout,
             verify=verify_ssl,
             headers=self._get_headers(),
+            auth=self._auth,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
         )
     
-    def _get_headers(self) -> Dict[str, str]:
+    def _get_headers(self) -> httpx.Headers:
         """Get default headers for API requests."""
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": f"blacklake-sdk-python/{__import__('blacklake').__version__}",
-        }
-        
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        
-        return headers
+        return self._default_headers
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -69,8 +255,21 @@ class BlackLakeClient:
     
     async def close(self):
         """Close the HTTP client."""
+        if self._suggest_batcher is not None:
+            self._suggest_batcher.close()
         await self._client.aclose()
     
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        Drop cached GET responses whose endpoint starts with `prefix`.
+
+        Called automatically by mutating methods; an empty prefix clears
+        the whole cache.
+        """
+        stale = [key for key in self._response_cache if key[1].startswith(prefix)]
+        for key in stale:
+            self._response_cache.pop(key, None)
+
     async def _request(
         self,
         method: str,
@@ -80,67 +279,171 @@ class BlackLakeClient:
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """
-        Make an HTTP request to the API.
-        
+        Make an HTTP request to the API, serving idempotent GETs from the
+        TTL cache when fresh.
+
         Args:
             method: HTTP method
             endpoint: API endpoint
             params: Query parameters
             json: JSON payload
             headers: Additional headers
-            
+
         Returns:
             Response data
-            
+
         Raises:
             BlackLakeError: For API errors
         """
-        request_headers = self._get_headers()
-        if headers:
-            request_headers.update(headers)
-        
+        if method != "GET" or headers or not self._cache_ttl:
+            return await self._do_request(method, endpoint, params, json, headers)
+
+        cache_key = (method, endpoint, tuple(sorted(params.items())) if params else ())
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent identical requests behind one lock so only
+        # the first caller hits the network (stampede protection)
+        lock = self._inflight.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            try:
+                etag_entry = self._etags.get(cache_key)
+                conditional = {"If-None-Match": etag_entry[0]} if etag_entry else None
+                raw = await self._request_raw(method, endpoint, params, json, conditional)
+                if raw.status_code == 304 and etag_entry is not None:
+                    response = etag_entry[1]
+                else:
+                    response = self._decode_response(raw)
+                    etag = raw.headers.get("etag")
+                    if etag:
+                        self._etags[cache_key] = (etag, response)
+            finally:
+                self._inflight.pop(cache_key, None)
+            self._response_cache[cache_key] = response
+            return response
+
+    async def _do_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Issue an HTTP request and decode the response."""
+        response = await self._request_raw(method, endpoint, params, json, headers)
+        return self._decode_response(response)
+
+    @staticmethod
+    def _decode_response(response: httpx.Response) -> Dict[str, Any]:
+        """Decode a response body exactly once (orjson is much faster than
+        stdlib json on large list/search payloads)."""
+        if response.headers.get("content-type", "").startswith("application/json") and response.content:
+            return orjson.loads(response.content)
+        else:
+            return {"data": response.text}
+
+    async def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """Issue an HTTP request and return the raw response after status checks."""
+        # Serialize bodies with orjson and hand httpx raw bytes; the
+        # client's default Content-Type header already declares JSON
+        content = orjson.dumps(json) if json is not None else None
+
+        # Retry transport errors and transient statuses with exponential
+        # backoff + jitter so one blip costs a short sleep, not a failed
+        # caller-level operation
+        response: Optional[httpx.Response] = None
         try:
-            response = await self._client.request(
-                method=method,
-                url=endpoint,
-                params=params,
-                json=json,
-                headers=request_headers,
-            )
-            
-            # Handle different status codes
-            if response.status_code == 401:
-                raise AuthenticationError("Authentication failed")
-            elif response.status_code == 403:
-                raise AuthorizationError("Access denied")
-            elif response.status_code == 404:
-                raise NotFoundError("Resource not found")
-            elif response.status_code >= 400:
-                error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
-                error_message = error_data.get("error", f"HTTP {response.status_code}")
-                raise BlackLakeError(f"API error: {error_message}")
-            
-            # Parse response
-            if response.headers.get("content-type", "").startswith("application/json"):
-                return response.json()
-            else:
-                return {"data": response.text}
-                
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(4),
+                wait=wait_exponential_jitter(initial=0.1, max=2.0),
+                retry=retry_if_exception_type((httpx.TransportError, _RetryableStatus)),
+                reraise=True,
+            ):
+                with attempt:
+                    response = await self._client.request(
+                        method=method,
+                        url=endpoint,
+                        params=params,
+                        content=content,
+                        headers=headers,
+                    )
+                    if response.status_code in _RETRYABLE_STATUS:
+                        retry_after = response.headers.get("retry-after")
+                        if response.status_code == 429 and retry_after is not None:
+                            try:
+                                await asyncio.sleep(float(retry_after))
+                            except ValueError:
+                                pass
+                        raise _RetryableStatus()
+        except _RetryableStatus:
+            # Retries exhausted; fall through to regular status dispatch
+            pass
         except httpx.RequestError as e:
             raise BlackLakeError(f"Request failed: {e}")
+
+        # Handle different status codes
+        exc = _STATUS_EXC.get(response.status_code)
+        if exc is not None:
+            raise exc[0](exc[1])
+        elif response.status_code >= 400:
+            error_message = f"HTTP {response.status_code}"
+            if response.headers.get("content-type", "").startswith("application/json") and response.content:
+                try:
+                    error_message = orjson.loads(response.content).get("error", error_message)
+                except orjson.JSONDecodeError:
+                    pass
+            raise BlackLakeError(f"API error: {error_message}")
+
+        return response
     
     # Repository operations
     
     async def list_repositories(self) -> List[Repository]:
         """List all accessible repositories."""
         response = await self._request("GET", "/v1/repos")
-        return [Repository(**repo) for repo in response.get("data", [])]
+        return _RepoListAdapter.validate_python(response.get("data", []))
     
     async def get_repository(self, name: str) -> Repository:
         """Get repository details."""
-        response = await self._request("GET", f"/v1/repos/{name}")
+        response = await self._request("GET", self._REPO_URL(repo=_quote(name)))
         return Repository(**response["data"])
     
+    async def get_repositories(
+        self,
+        names: List[str],
+        concurrency: int = 16,
+    ) -> List[Repository]:
+        """
+        Get details for several repositories concurrently.
+
+        Requests are issued in parallel under a bounded semaphore (with
+        HTTP/2 they multiplex over one connection), so total latency is
+        close to a single round-trip rather than one per name.
+
+        Args:
+            names: Repository names to fetch
+            concurrency: Maximum number of in-flight requests
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(name: str) -> Repository:
+            async with sem:
+                return await self.get_repository(name)
+
+        return list(await asyncio.gather(*(_one(name) for name in names)))
+
     async def create_repository(
         self,
         name: str,
@@ -152,6 +455,7 @@ class BlackLakeClient:
             payload["description"] = description
         
         response = await self._request("POST", "/v1/repos", json=payload)
+        self.invalidate("/v1/repos")
         return Repository(**response["data"])
     
     async def get_repository_tree(
@@ -167,7 +471,7 @@ class BlackLakeClient:
         
         response = await self._request(
             "GET",
-            f"/v1/repos/{repo_name}/tree/{ref}",
+            self._TREE_URL(repo=_quote(repo_name), ref=_quote(ref)),
             params=params,
         )
         return TreeResponse(**response)
@@ -191,6 +495,10 @@ class BlackLakeClient:
             offset: Number of results to skip
             repo: Filter by repository name
             classification: Filter by data classification
+
+        When msgspec is installed (the `fast` extra), the payload is
+        decoded straight into Struct instances exposing the same read
+        API as SearchResponse, skipping Pydantic on the hot path.
         """
         params = {
             "q": query,
@@ -203,18 +511,67 @@ class BlackLakeClient:
         if classification:
             params["classification"] = classification
         
+        if _SEARCH_DECODER is not None:
+            response = await self._request_raw("GET", "/v1/search", params=params)
+            return _SEARCH_DECODER.decode(response.content)
+
         response = await self._request("GET", "/v1/search", params=params)
         return SearchResponse(**response)
     
+    async def iter_search(
+        self,
+        query: str,
+        page_size: int = 50,
+        repo: Optional[str] = None,
+        classification: Optional[str] = None,
+    ) -> AsyncIterator[SearchResult]:
+        """
+        Iterate over all search results, one page at a time.
+
+        The next page is requested while the caller consumes the current
+        one (double-buffering), overlapping network and parse time with
+        caller-side work.
+
+        Args:
+            query: Search query
+            page_size: Number of results per page
+            repo: Filter by repository name
+            classification: Filter by data classification
+        """
+        offset = 0
+        next_task = asyncio.ensure_future(
+            self.search(query, limit=page_size, offset=offset, repo=repo, classification=classification)
+        )
+        while True:
+            response = await next_task
+            results = response.results
+            if not results:
+                return
+            offset += page_size
+            next_task = asyncio.ensure_future(
+                self.search(query, limit=page_size, offset=offset, repo=repo, classification=classification)
+            )
+            for result in results:
+                yield result
+            if len(results) < page_size:
+                # Short page means we just yielded the tail; drop the prefetch
+                next_task.cancel()
+                return
+
     async def search_suggestions(
         self,
         query: str,
         count: int = 10,
     ) -> List[str]:
-        """Get search suggestions."""
-        params = {"q": query, "count": count}
-        response = await self._request("GET", "/v1/search/suggest", params=params)
-        return response.get("data", [])
+        """
+        Get search suggestions.
+
+        Calls arriving within a short window are micro-batched and fired
+        together, so per-keystroke typeahead traffic shares round-trips.
+        """
+        if self._suggest_batcher is None:
+            self._suggest_batcher = _SuggestBatcher(self)
+        return await self._suggest_batcher.submit(query, count)
     
     # File operations
     
@@ -227,10 +584,32 @@ class BlackLakeClient:
         """Get file metadata."""
         response = await self._request(
             "GET",
-            f"/v1/repos/{repo_name}/metadata/{ref}/{path}",
+            self._METADATA_URL(
+                repo=_quote(repo_name), ref=_quote(ref), path=quote(path, safe="/")
+            ),
         )
         return response["data"]
     
+    async def get_file_metadata_bulk(
+        self,
+        specs: List[Tuple[str, str, str]],
+        concurrency: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get metadata for several files concurrently.
+
+        Args:
+            specs: (repo_name, ref, path) tuples to fetch
+            concurrency: Maximum number of in-flight requests
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(spec: Tuple[str, str, str]) -> Dict[str, Any]:
+            async with sem:
+                return await self.get_file_metadata(*spec)
+
+        return list(await asyncio.gather(*(_one(spec) for spec in specs)))
+
     async def update_file_metadata(
         self,
         repo_name: str,
@@ -241,9 +620,12 @@ class BlackLakeClient:
         """Update file metadata."""
         response = await self._request(
             "PUT",
-            f"/v1/repos/{repo_name}/metadata/{ref}/{path}",
+            self._METADATA_URL(
+                repo=_quote(repo_name), ref=_quote(ref), path=quote(path, safe="/")
+            ),
             json=metadata,
         )
+        self.invalidate(self._REPO_URL(repo=_quote(repo_name)))
         return response["data"]
     
     # Upload operations
@@ -264,7 +646,7 @@ class BlackLakeClient:
         
         response = await self._request(
             "POST",
-            f"/v1/repos/{repo_name}/upload/init",
+            self._UPLOAD_INIT_URL(repo=_quote(repo_name)),
             json=payload,
         )
         return response["data"]
@@ -287,9 +669,10 @@ class BlackLakeClient:
         
         response = await self._request(
             "POST",
-            f"/v1/repos/{repo_name}/commit",
+            self._COMMIT_URL(repo=_quote(repo_name)),
             json=payload,
         )
+        self.invalidate(self._REPO_URL(repo=_quote(repo_name)))
         return response["data"]
     
     # Export operations
@@ -304,7 +687,7 @@ class BlackLakeClient:
         params = {"ref": ref, "format": format}
         response = await self._request(
             "POST",
-            f"/v1/repos/{repo_name}/export",
+            self._EXPORT_URL(repo=_quote(repo_name)),
             params=params,
         )
         return response["data"]
@@ -314,8 +697,53 @@ class BlackLakeClient:
         export_id: str,
     ) -> Dict[str, Any]:
         """Get export status."""
-        response = await self._request("GET", f"/v1/exports/{export_id}")
+        response = await self._request("GET", self._EXPORT_STATUS_URL(export_id=_quote(export_id)))
         return response["data"]
+
+    async def download_export(
+        self,
+        export_id: str,
+        dest_path: Optional[str] = None,
+        sink: Optional[Callable[[bytes], Awaitable[None]]] = None,
+        chunk_size: int = 1 << 20,
+    ) -> None:
+        """
+        Download a finished export archive without buffering it in memory.
+
+        The response body is streamed in fixed-size chunks, so memory use
+        stays constant regardless of archive size.
+
+        Args:
+            export_id: Export ID
+            dest_path: File path to write the archive to
+            sink: Async callable receiving each chunk (alternative to dest_path)
+            chunk_size: Chunk size in bytes (default 1 MiB)
+
+        Raises:
+            ValueError: If neither dest_path nor sink is given
+            BlackLakeError: For API errors
+        """
+        if dest_path is None and sink is None:
+            raise ValueError("Either dest_path or sink must be provided")
+
+        try:
+            async with self._client.stream(
+                "GET", self._EXPORT_DOWNLOAD_URL(export_id=_quote(export_id))
+            ) as response:
+                if response.status_code == 404:
+                    raise NotFoundError("Export not found")
+                elif response.status_code >= 400:
+                    raise BlackLakeError(f"API error: HTTP {response.status_code}")
+
+                if sink is not None:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        await sink(chunk)
+                else:
+                    with open(dest_path, "wb") as f:
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            f.write(chunk)
+        except httpx.RequestError as e:
+            raise BlackLakeError(f"Request failed: {e}")
     
     # Health check
     
@@ -325,30 +753,89 @@ class BlackLakeClient:
         return response
 
 
+# One background loop shared by every BlackLakeClientSync instance so
+# their clients (and keep-alive connections) all live on a running loop
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None or _sync_loop.is_closed():
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(target=_sync_loop.run_forever, daemon=True).start()
+        return _sync_loop
+
+
 # Synchronous wrapper for convenience
 class BlackLakeClientSync:
-    """Synchronous wrapper for BlackLakeClient."""
-    
+    """
+    Synchronous wrapper for BlackLakeClient.
+
+    The async client runs on a background event-loop thread shared by all
+    sync instances, and calls are bridged with
+    `asyncio.run_coroutine_threadsafe`, so HTTP keep-alive connections
+    persist across calls instead of being dropped with a per-call loop.
+    The client itself is constructed lazily on that loop, ensuring httpx
+    binds its resources to the loop that actually runs the requests.
+    Wrapper methods are generated once at import time rather than
+    dispatched through `__getattr__` per invocation.
+    """
+
     def __init__(self, *args, **kwargs):
-        self._client = BlackLakeClient(*args, **kwargs)
-        self._loop = None
-    
+        self._args = args
+        self._kwargs = kwargs
+        self._loop = _get_sync_loop()
+        self._client: Optional[BlackLakeClient] = None
+
     def __enter__(self):
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self._loop:
-            self._loop.close()
-    
-    def __getattr__(self, name):
-        """Delegate method calls to the async client."""
-        method = getattr(self._client, name)
-        
-        if asyncio.iscoroutinefunction(method):
-            def sync_wrapper(*args, **kwargs):
-                return self._loop.run_until_complete(method(*args, **kwargs))
-            return sync_wrapper
-        else:
-            return method
+        self.close()
+
+    def close(self):
+        """Close the underlying client (the shared loop keeps running)."""
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result()
+            self._client = None
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop cached GET responses whose endpoint starts with `prefix`."""
+        self._ensure_client().invalidate(prefix)
+
+    def _ensure_client(self) -> BlackLakeClient:
+        """Construct the async client on the background loop on first use."""
+        if self._client is None:
+
+            async def _make() -> BlackLakeClient:
+                return BlackLakeClient(*self._args, **self._kwargs)
+
+            self._client = asyncio.run_coroutine_threadsafe(_make(), self._loop).result()
+        return self._client
+
+    def _run(self, coro):
+        """Run a coroutine on the background loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+def _make_sync_wrapper(method):
+    """Build a blocking wrapper around an async BlackLakeClient method."""
+
+    @functools.wraps(method)
+    def sync_wrapper(self, *args, **kwargs):
+        return self._run(method(self._ensure_client(), *args, **kwargs))
+
+    return sync_wrapper
+
+
+# Generate the sync wrapper table once: every public coroutine method of
+# BlackLakeClient gets a blocking counterpart of the same name
+for _name in dir(BlackLakeClient):
+    if not _name.startswith("_"):
+        _method = getattr(BlackLakeClient, _name)
+        if asyncio.iscoroutinefunction(_method) and _name != "close":
+            setattr(BlackLakeClientSync, _name, _make_sync_wrapper(_method))
+del _name, _method
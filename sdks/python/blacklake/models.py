@@ -5,13 +5,21 @@ Pydantic models for API responses and requests.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Response models are read-only DTOs; freezing them lets pydantic-core
+# skip mutability bookkeeping and shrinks per-instance state, which adds
+# up when a search response materializes thousands of instances
+_frozen_config = ConfigDict(frozen=True, extra="ignore")
 
 
 class Repository(BaseModel):
     """Repository model."""
     
+    model_config = _frozen_config
+    
     id: str = Field(..., description="Repository ID")
     name: str = Field(..., description="Repository name")
     description: Optional[str] = Field(None, description="Repository description")
@@ -20,9 +28,16 @@ class Repository(BaseModel):
     tenant_id: Optional[str] = Field(None, description="Tenant ID")
 
 
+# Module-level adapters validate whole lists in one pydantic-core call,
+# which is much faster than per-item Repository(**kwargs) construction
+_RepoListAdapter = TypeAdapter(List[Repository])
+
+
 class TreeEntry(BaseModel):
     """File tree entry model."""
     
+    model_config = _frozen_config
+    
     path: str = Field(..., description="File path")
     name: str = Field(..., description="File name")
     type: str = Field(..., description="Entry type (file or directory)")
@@ -35,6 +50,8 @@ class TreeEntry(BaseModel):
 class TreeResponse(BaseModel):
     """Tree response model."""
     
+    model_config = _frozen_config
+    
     success: bool = Field(..., description="Success status")
     data: List[TreeEntry] = Field(..., description="Tree entries")
 
@@ -42,6 +59,8 @@ class TreeResponse(BaseModel):
 class SearchResult(BaseModel):
     """Search result model."""
     
+    model_config = _frozen_config
+    
     id: str = Field(..., description="Result ID")
     repo_name: str = Field(..., description="Repository name")
     path: str = Field(..., description="File path")
@@ -54,9 +73,14 @@ class SearchResult(BaseModel):
     highlights: Optional[Dict[str, List[str]]] = Field(None, description="Search highlights")
 
 
+_SearchResultListAdapter = TypeAdapter(List[SearchResult])
+
+
 class SearchFacet(BaseModel):
     """Search facet model."""
     
+    model_config = _frozen_config
+    
     name: str = Field(..., description="Facet name")
     values: List[Dict[str, Union[str, int]]] = Field(..., description="Facet values")
 
@@ -64,30 +88,34 @@ class SearchFacet(BaseModel):
 class SearchResponse(BaseModel):
     """Search response model."""
     
+    # cached_property memoizes derived views so repeated access (e.g. read
+    # total, then iterate results) does not re-validate the payload
+    model_config = ConfigDict(frozen=True, ignored_types=(cached_property,))
+    
     success: bool = Field(..., description="Success status")
     data: Dict[str, Any] = Field(..., description="Search results data")
     
-    @property
+    @cached_property
     def results(self) -> List[SearchResult]:
         """Get search results."""
-        return [SearchResult(**result) for result in self.data.get("results", [])]
+        return _SearchResultListAdapter.validate_python(self.data.get("results", []))
     
-    @property
+    @cached_property
     def total(self) -> int:
         """Get total number of results."""
         return self.data.get("total", 0)
     
-    @property
+    @cached_property
     def limit(self) -> int:
         """Get result limit."""
         return self.data.get("limit", 20)
     
-    @property
+    @cached_property
     def offset(self) -> int:
         """Get result offset."""
         return self.data.get("offset", 0)
     
-    @property
+    @cached_property
     def facets(self) -> List[SearchFacet]:
         """Get search facets."""
         facets_data = self.data.get("facets", [])
@@ -97,6 +125,8 @@ class SearchResponse(BaseModel):
 class UploadInitResponse(BaseModel):
     """Upload initialization response model."""
     
+    model_config = _frozen_config
+    
     upload_id: str = Field(..., description="Upload ID")
     presigned_url: str = Field(..., description="Presigned upload URL")
     expires_at: datetime = Field(..., description="Upload expiration timestamp")
@@ -105,6 +135,8 @@ class UploadInitResponse(BaseModel):
 class CommitResponse(BaseModel):
     """Commit response model."""
     
+    model_config = _frozen_config
+    
     commit_id: str = Field(..., description="Commit ID")
     message: str = Field(..., description="Commit message")
     created_at: datetime = Field(..., description="Commit timestamp")
@@ -114,6 +146,8 @@ class CommitResponse(BaseModel):
 class ExportResponse(BaseModel):
     """Export response model."""
     
+    model_config = _frozen_config
+    
     export_id: str = Field(..., description="Export ID")
     status: str = Field(..., description="Export status")
     created_at: datetime = Field(..., description="Export creation timestamp")
@@ -123,6 +157,8 @@ class ExportResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response model."""
     
+    model_config = _frozen_config
+    
     status: str = Field(..., description="Health status")
     timestamp: datetime = Field(..., description="Check timestamp")
     version: Optional[str] = Field(None, description="API version")
@@ -132,6 +168,8 @@ class HealthResponse(BaseModel):
 class Policy(BaseModel):
     """Access policy model."""
     
+    model_config = _frozen_config
+    
     id: str = Field(..., description="Policy ID")
     tenant_id: str = Field(..., description="Tenant ID")
     name: str = Field(..., description="Policy name")
@@ -146,6 +184,8 @@ class Policy(BaseModel):
 class Tenant(BaseModel):
     """Tenant model."""
     
+    model_config = _frozen_config
+    
     id: str = Field(..., description="Tenant ID")
     name: str = Field(..., description="Tenant name")
     created_at: datetime = Field(..., description="Creation timestamp")
@@ -154,6 +194,8 @@ class Tenant(BaseModel):
 class SubjectAttribute(BaseModel):
     """Subject attribute model."""
     
+    model_config = _frozen_config
+    
     subject: str = Field(..., description="Subject identifier")
     key: str = Field(..., description="Attribute key")
     value: str = Field(..., description="Attribute value")
@@ -163,6 +205,8 @@ class SubjectAttribute(BaseModel):
 class ApiResponse(BaseModel):
     """Generic API response model."""
     
+    model_config = _frozen_config
+    
     success: bool = Field(..., description="Success status")
     data: Any = Field(..., description="Response data")
     error: Optional[str] = Field(None, description="Error message")